@@ -1,26 +1,181 @@
 import anthropic
+import hashlib
 import json
-from dataclasses import asdict
+import time
+from datetime import date
+
+# orjson serializes the large tool results several times faster than the
+# stdlib json module; fall back gracefully if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Stable instruction block appended to both system prompts. Keeping it
+# identical across turns lets the API serve the system prompt from
+# cache; it must also be long enough that the total prefix clears
+# Anthropic's 1024-token minimum cacheable size, below which prompts are
+# silently never cached.
+SYSTEM_PROMPT_GUIDE = """
+    Reference notes (stable across queries):
+
+    Data schema:
+    - The get_upcoming_matchups tool returns a JSON list of events. Each event has: name, date, location, event_url, and a list of fights.
+    - Each fight has: fight_url, fighter_1, fighter_2, weight_class, title_fight, fighter_1_stats, fighter_2_stats.
+    - Fighter stats include a "stats" mapping of career statistics and a "recent_fights" list ordered newest first.
+    - Recent fight entries are short summaries of a fighter's latest bouts. A longer run of wins indicates momentum; losses or long layoffs are worth flagging in the analysis.
+    - An empty "fights" list on an event means no bouts matched the requested filters; empty "stats" or "recent_fights" means the source page had no data for that fighter.
+
+    Career statistics glossary (keys that may appear in "stats"):
+    - Wins/Losses/Draws: professional MMA record. A high win total with few losses signals an established contender; heavy losses late in a career often signal decline.
+    - Height, Weight, Reach: physical attributes. Reach is the fingertip-to-fingertip span in inches; a significant reach advantage favors fighters who strike at range.
+    - Stance: Orthodox, Southpaw, or Switch. Southpaw-versus-orthodox matchups often produce open-stance dynamics worth mentioning.
+    - DOB: date of birth; use it to discuss age gaps, athletic primes, and durability concerns for fighters over roughly 35.
+    - SLpM: significant strikes landed per minute; higher values indicate a more active, volume-oriented striker.
+    - Str. Acc.: significant-strike accuracy as a percentage; pair with SLpM to distinguish precise counter-strikers from volume pressure fighters.
+    - SApM: significant strikes absorbed per minute; a high value means the fighter gets hit often, which matters against powerful strikers.
+    - Str. Def: percentage of opponent significant strikes avoided; a strong defensive metric for durability assessments.
+    - TD Avg.: takedowns landed per 15 minutes; the core measure of a wrestler's offensive grappling threat.
+    - TD Acc.: takedown accuracy as a percentage; low accuracy with high attempts suggests a grinding, chain-wrestling style.
+    - TD Def.: percentage of opponent takedown attempts stuffed; crucial when a striker faces a wrestler.
+    - Sub. Avg.: submission attempts per 15 minutes; indicates how dangerous a fighter is once the fight hits the ground.
+
+    Weight classes (upper limits): Flyweight (125 lb), Bantamweight (135 lb), Featherweight (145 lb), Lightweight (155 lb), Welterweight (170 lb), Middleweight (185 lb), Light Heavyweight (205 lb), Heavyweight (265 lb), Women's Strawweight (115 lb), Women's Flyweight (125 lb), Women's Bantamweight (135 lb).
+
+    Filter semantics for get_upcoming_matchups:
+    - max_events limits how many upcoming events are scanned, starting from the soonest. Keep it at 1 unless the query clearly reaches beyond the next card (a named fighter, a title fight, or an explicit request for multiple events), and never raise it above 10.
+    - title_fights_only restricts results to championship bouts; combine it with a larger max_events, since most cards have at most one title fight.
+    - weight_class filters to a single division and must match one of the division names listed above exactly, including the "Women's" prefix for the women's divisions.
+
+    Analysis guidelines:
+    - Frame each matchup as a stylistic question: striker versus wrestler, volume versus power, pressure versus counter. Use the statistics above as evidence for the framing.
+    - When comparing two fighters, contrast the relevant numbers directly (for example, one fighter's TD Avg. against the other's TD Def.) rather than listing each fighter's stats in isolation.
+    - Title fights carry championship stakes; note when a belt is on the line and what a win would mean for each fighter.
+    - Flag statistical mismatches: a large reach gap, a big disparity in SApM, or a grappler with high TD Avg. against an opponent with weak TD Def. all suggest a path to victory.
+    - For upset analysis, look for live underdogs: defensive soundness (high Str. Def, high TD Def.) against an aggressive favorite, or a finisher's Sub. Avg. against an opponent who has been submitted recently.
+    - Be honest about uncertainty. If the data does not support a confident pick, say what would swing the fight either way instead of forcing a prediction.
+
+    Style guide:
+    - Write in plain, engaging prose; refer to fighters by name.
+    - Cite concrete numbers from the stats when comparing fighters.
+    - Keep each fight's analysis tight: a few sentences on the stylistic matchup, the key statistical edges, and a bottom line.
+    - Never invent fights, fighters, dates, or statistics that are not in the data; if no data is available for a request, acknowledge that to the user.
+    """
+
+
+# One Anthropic client per process: constructing the client sets up
+# connection pools and reads credentials, so reusing it lets warm
+# serverless invocations (and repeated Agent construction) skip that
+# cost and keep pooled connections alive
+_CLIENT = None
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = anthropic.Anthropic()
+    return _CLIENT
+
+
+# Thinking configs never change per call, so share two module-level
+# dicts instead of rebuilding them on every query
+_THINKING_ENABLED = {"type": "enabled", "budget_tokens": 16000}
+_THINKING_DISABLED = {"type": "disabled"}
+
+
+class ResponseCache:
+    """
+    In-process exact-match cache for final agent responses.
+
+    Keys combine the normalized query with today's date so cached answers
+    expire automatically when the upcoming-events data rolls over, in
+    addition to the short TTL.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._entries = {}
+
+    def _hash(self, query):
+        key = f"{query.strip().lower()}:{date.today().isoformat()}"
+        return hashlib.md5(key.encode()).hexdigest()
+
+    def get(self, query):
+        entry = self._entries.get(self._hash(query))
+        if entry is None:
+            return None
+
+        response, stored_at = entry
+        if time.time() - stored_at > self.ttl:
+            return None
+
+        return response
+
+    def set(self, query, response):
+        self._entries[self._hash(query)] = (response, time.time())
 
 
 class Agent:
     def __init__(
         self,
         model="claude-3-7-sonnet-20250219",
-        tools=[],
+        tools=None,
         verbose=True,
     ):
-        self.client = anthropic.Anthropic()
+        self.client = _get_client()
         self.model = model
-        self.tools = {}
         self.verbose = verbose
-
-        for tool in tools:
-            self.tools[tool.name] = tool
+        self.tools = {tool.name: tool for tool in tools} if tools else {}
 
         # Format tools for Claude API
         self.claude_tools = [tool.to_claude_format() for tool in self.tools.values()]
+
+        # Mark the last tool as a cache breakpoint so the (static) tool
+        # definitions are cached server-side across queries. Replace the
+        # element with an annotated copy: to_claude_format memoizes its
+        # dict on the Tool, so mutating it in place would leak the
+        # marker into every other agent sharing that tool.
+        if self.claude_tools:
+            self.claude_tools[-1] = {
+                **self.claude_tools[-1],
+                "cache_control": {"type": "ephemeral"},
+            }
+
         self.messages = []
+        self.response_cache = ResponseCache()
+
+        # Arguments shared by every messages.create call
+        self._base_request = {
+            "model": self.model,
+            "max_tokens": 20000,
+            "tools": self.claude_tools,
+        }
+
+    def _cached_system(self, system_msg):
+        """
+        Format a system prompt as a cacheable content block.
+        """
+        return [
+            {
+                "type": "text",
+                "text": system_msg + SYSTEM_PROMPT_GUIDE,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    def _log_cache_usage(self, response):
+        usage = response.usage
+        self._log(
+            "PROMPT CACHE USAGE",
+            {
+                "cache_creation_input_tokens": getattr(
+                    usage, "cache_creation_input_tokens", None
+                ),
+                "cache_read_input_tokens": getattr(
+                    usage, "cache_read_input_tokens", None
+                ),
+            },
+        )
 
     def _log(self, title, content):
         if not self.verbose:
@@ -33,15 +188,13 @@ class Agent:
         title_str = f"{'=' * 10} {title} {'=' * (width - len(title) - 12)}"
         print(f"{title_str}")
 
-        # Format the content based on type
-        if isinstance(content, dict) or isinstance(content, list):
-            try:
-                print(json.dumps(content, indent=2))
-            except:
-                print(str(content))
-        elif hasattr(content, "__dict__"):
+        # Format the content based on type; strings (including the
+        # pre-serialized JSON from _execute_tool) are printed as-is
+        if isinstance(content, str):
+            print(content)
+        elif isinstance(content, dict) or isinstance(content, list):
             try:
-                print(json.dumps(asdict(content), indent=2))
+                print(json.dumps(content, indent=2, default=str))
             except:
                 print(str(content))
         else:
@@ -51,6 +204,16 @@ class Agent:
 
     def run(self, query, thinking_mode=False):
         self._log("USER QUERY", query)
+
+        # Serve repeated queries from the response cache without any API
+        # or network calls
+        cached_response = self.response_cache.get(query)
+        if cached_response is not None:
+            self._log("FINAL RESPONSE (CACHED)", cached_response)
+            self.messages.append({"role": "user", "content": query})
+            self.messages.append({"role": "assistant", "content": cached_response})
+            return cached_response
+
         self.messages.append({"role": "user", "content": query})
 
         thinking_config = self._get_thinking_config(thinking_mode)
@@ -67,6 +230,7 @@ class Agent:
             # no tool was selected
             final_response = tool_use_response["text_block"].text
             self._log("FINAL RESPONSE (NO TOOL USED)", final_response)
+            self.response_cache.set(query, final_response)
             return final_response
 
         self._log("TOOL SELECTED", f"Using {tool_use_response['tool_use_block'].name}")
@@ -90,8 +254,9 @@ class Agent:
         self._log("STEP 2", "Executing Tool")
         tool_result = self._execute_tool(tool_use_response["tool_use_block"])
 
-        # Log a preview of the tool result (truncated if very large)
-        result_preview = str(tool_result)
+        # Log a preview of the tool result (truncated if very large);
+        # the result is already a JSON string, so no re-serialization
+        result_preview = tool_result
         if len(result_preview) > 500:
             result_preview = result_preview[:500] + "... [truncated]"
         self._log("TOOL EXECUTION RESULT (PREVIEW)", result_preview)
@@ -113,28 +278,31 @@ class Agent:
         self._log("STEP 3", "Generating Final Response")
         final_response = self._final_response(thinking_config)
         self._log("FINAL RESPONSE", final_response)
+        self.response_cache.set(query, final_response)
         return final_response
 
     def _get_thinking_config(self, thinking_mode):
-        if thinking_mode:
-            thinking_config = {"type": "enabled", "budget_tokens": 16000}
-        else:
-            thinking_config = {"type": "disabled"}
-        return thinking_config
+        return _THINKING_ENABLED if thinking_mode else _THINKING_DISABLED
 
-    def _tool_use(self, thinking_config):
-        system_msg = """
-        Your task is to determine what UFC fight data to retrieve. Analyze user's query to choose appropriate parameters for the get_upcoming_matchups tool. Consider increasing max_events (up to 10) if you need to look beyond the next event (e.g., when user asks for title fights or specific fighters that may not appear in the immediate event).
+    def _create_message(self, system_msg, thinking_config):
+        """
+        Issue a Claude API call with the arguments shared by both phases.
         """
-
         response = self.client.messages.create(
-            model=self.model,
-            max_tokens=20000,
             thinking=thinking_config,
-            tools=self.claude_tools,
-            system=system_msg,
+            system=self._cached_system(system_msg),
             messages=self.messages,
+            **self._base_request,
         )
+        self._log_cache_usage(response)
+        return response
+
+    def _tool_use(self, thinking_config):
+        system_msg = """
+        Your task is to determine what UFC fight data to retrieve. Analyze user's query to choose appropriate parameters for the get_upcoming_matchups tool. Consider increasing max_events (up to 10) if you need to look beyond the next event (e.g., when user asks for title fights or specific fighters that may not appear in the immediate event).
+        """
+
+        response = self._create_message(system_msg, thinking_config)
 
         thinking_block = next(
             (block for block in response.content if block.type == "thinking"),
@@ -173,7 +341,9 @@ class Agent:
             result = self.tools[tool_name](**tool_input)
 
             # convert to JSON
-            result = [asdict(event) for event in result]
+            result = [event.to_dict() for event in result]
+            if orjson is not None:
+                return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
             return json.dumps(result, indent=2)
         except Exception as e:
             return f"Error: {str(e)}"
@@ -186,14 +356,7 @@ class Agent:
         Provide insightful fight recommendations based on the user's request and the UFC data. If no data is available, acknowledge to the user. Keep your analysis concise but informative and engaging.
         """
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=20000,
-            thinking=thinking_config,
-            tools=self.claude_tools,
-            system=system_msg,
-            messages=self.messages,
-        )
+        response = self._create_message(system_msg, thinking_config)
 
         final_text = response.content[-1].text
 
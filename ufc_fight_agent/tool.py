@@ -1,7 +1,20 @@
 import inspect
 import json
+import re
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Any, Optional, List, get_type_hints, Union
+from functools import lru_cache
+from types import UnionType
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Optional,
+    List,
+    get_args,
+    get_origin,
+    get_type_hints,
+    Union,
+)
 from ufc_fight_agent.ufc_data import *
 
 
@@ -11,13 +24,17 @@ class Tool:
     description: str
     parameters: dict[str, dict[str, Any]]
     func: Callable[..., Any]
+    _claude_format: Optional[dict] = field(default=None, init=False, repr=False)
 
     def __call__(self, **kwargs):
         return self.func(**kwargs)
 
     def to_claude_format(self):
-        """Convert to Claude's expected format"""
-        return {
+        """Convert to Claude's expected format (computed once and cached)"""
+        if self._claude_format is not None:
+            return self._claude_format
+
+        self._claude_format = {
             "name": self.name,
             "description": self.description,
             "input_schema": {
@@ -30,6 +47,12 @@ class Tool:
                 ],
             },
         }
+        return self._claude_format
+
+
+# Compiled once at import time rather than re-scanning line by line
+_PARAMS_HEADER_RE = re.compile(r"^[ \t]*Parameters:[ \t]*$", re.MULTILINE)
+_PARAM_LINE_RE = re.compile(r"^-+\s*([^:]+?)\s*:\s*(.*)$")
 
 
 def parse_docstring_params(docstring):
@@ -37,54 +60,87 @@ def parse_docstring_params(docstring):
     Extract parameter descriptions from a function's docstring.
     """
     params = {}
-    lines = docstring.split("\n")
 
     # locate the 'Parameters:' line
-    for i, line in enumerate(lines):
-        if line.strip() == "Parameters:":
-            break
-    else:
+    header = _PARAMS_HEADER_RE.search(docstring)
+    if not header:
         return params
 
     current_param = None
-    for line in lines[i + 1 :]:
+    for line in docstring[header.end() :].split("\n")[1:]:
         line = line.strip()
         if not line:
             break
 
-        if line.startswith("-"):
-            line = line.lstrip("- ")
-            key, value = line.split(":", 1)
-            current_param = key.strip()
-            params[current_param] = value.strip()
-        elif current_param and line:
+        match = _PARAM_LINE_RE.match(line)
+        if match:
+            current_param = match.group(1)
+            params[current_param] = match.group(2)
+        elif current_param:
             # Continuation of previous parameter description
             params[current_param] = params[current_param] + " " + line
 
     return params
 
 
-def python_type_to_json_schema(type_str):
+# Built once at import time and keyed by type object, so lookups are a
+# single dict hit instead of scanning type reprs as strings
+_TYPE_MAP = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+
+def python_type_to_json_schema(py_type):
     """
-    Convert Python type string to JSON schema type.
+    Convert a Python type annotation to a JSON schema type.
     """
-    type_map = {
-        "str": "string",
-        "int": "integer",
-        "float": "number",
-        "bool": "boolean",
-        "list": "array",
-        "dict": "object",
-        "None": "null",
-    }
-
-    for py_type, json_type in type_map.items():
-        if py_type in type_str:
-            return json_type
+    json_type = _TYPE_MAP.get(py_type)
+    if json_type is not None:
+        return json_type
+
+    # Generics like list[str] or dict[str, str] map via their origin
+    origin = get_origin(py_type)
+    if origin is not None:
+        return _TYPE_MAP.get(origin, "string")
 
     return "string"
 
 
+def _unwrap_optional(py_type):
+    """
+    Detect Optional[X] / X | None annotations and return (is_optional,
+    inner type), where the inner type is the first non-None union member.
+    """
+    if get_origin(py_type) not in (Union, UnionType):
+        return False, py_type
+
+    args = get_args(py_type)
+    if type(None) not in args:
+        return False, py_type
+
+    inner_type = next(arg for arg in args if arg is not type(None))
+    return True, inner_type
+
+
+# Reflection over annotations and signatures is comparatively expensive;
+# cache it per function so re-decorating (e.g. re-running a notebook
+# cell) or wrapping the same function twice does the work once
+@lru_cache(maxsize=None)
+def _get_cached_type_hints(func):
+    return get_type_hints(func)
+
+
+@lru_cache(maxsize=None)
+def _get_cached_signature(func):
+    return inspect.signature(func)
+
+
 def tool(func):
     """
     Decorator to convert a function into a Tool.
@@ -101,21 +157,15 @@ def tool(func):
     param_descriptions = parse_docstring_params(docstring)
 
     # Get type annotations
-    type_hints = get_type_hints(func)
-    sig = inspect.signature(func)
+    type_hints = _get_cached_type_hints(func)
+    sig = _get_cached_signature(func)
 
     # Build parameter schema
     parameters = {}
     for param_name, param in sig.parameters.items():
         param_type = type_hints.get(param_name, Any)
-        is_optional = "Optional" in str(param_type)
-
-        if is_optional:
-            # Extract inner type from Optional[X]
-            inner_type = str(param_type).split("[")[1].split("]")[0]
-            json_type = python_type_to_json_schema(inner_type)
-        else:
-            json_type = python_type_to_json_schema(str(param_type))
+        is_optional, inner_type = _unwrap_optional(param_type)
+        json_type = python_type_to_json_schema(inner_type)
 
         param_info = {
             "type": json_type,
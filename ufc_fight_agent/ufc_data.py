@@ -1,10 +1,61 @@
+import asyncio
+import hashlib
+import json
 import requests
+import soupsieve
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
 from typing import Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dataclasses import dataclass, field
-
-
-@dataclass
+from requests.adapters import HTTPAdapter
+
+# On-disk cache for scraped pages so repeated queries within a day skip
+# the network entirely
+_CACHE_DIR = Path(tempfile.gettempdir()) / "ufc_fight_agent_cache"
+
+# Shared session so repeated scrapes reuse pooled keep-alive connections
+# instead of paying a fresh TCP handshake per request
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# lxml parses these pages several times faster than the stdlib parser;
+# fall back gracefully if it is not installed
+try:
+    import lxml  # noqa: F401
+
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+# httpx is only needed for the async bulk fetcher
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# Precompiled selectors for the matchup tables; soup.select() otherwise
+# re-resolves the CSS pattern through soupsieve's cache on every row
+_MATCHUP_ROW = soupsieve.compile("tr")
+_MATCHUP_HEADER = soupsieve.compile("th.b-fight-details__table-col")
+_MATCHUP_COLS = soupsieve.compile("td.b-fight-details__table-col")
+
+# Only the table rows matter on the events listing page; straining the
+# parse to <tr> elements skips building a tree for the rest of the page
+_EVENT_ROW_STRAINER = SoupStrainer("tr")
+
+
+# slots=True shrinks per-instance memory and speeds attribute access,
+# which matters when a query materializes stats for dozens of fights
+@dataclass(slots=True)
 class Event:
     name: str
     date: str
@@ -12,14 +63,29 @@ class Event:
     event_url: str
     fights: list = field(default_factory=list)
 
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "date": self.date,
+            "location": self.location,
+            "event_url": self.event_url,
+            "fights": [fight.to_dict() for fight in self.fights],
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class FighterStats:
     stats: dict[str, str] = field(default_factory=dict)
     recent_fights: list[str] = field(default_factory=list)
 
+    def to_dict(self):
+        return {
+            "stats": self.stats,
+            "recent_fights": self.recent_fights,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Fight:
     fight_url: str
     fighter_1: str
@@ -29,18 +95,29 @@ class Fight:
     fighter_1_stats: FighterStats = field(default_factory=FighterStats)
     fighter_2_stats: FighterStats = field(default_factory=FighterStats)
 
+    def to_dict(self):
+        return {
+            "fight_url": self.fight_url,
+            "fighter_1": self.fighter_1,
+            "fighter_2": self.fighter_2,
+            "weight_class": self.weight_class,
+            "title_fight": self.title_fight,
+            "fighter_1_stats": self.fighter_1_stats.to_dict(),
+            "fighter_2_stats": self.fighter_2_stats.to_dict(),
+        }
+
 
-def get_page_response(url: str):
+def get_page_response(url: str, extra_headers: Optional[dict] = None):
     """
     Gets the response from a URL with proper headers and error handling.
     """
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
+    headers = dict(_HEADERS)
+    if extra_headers:
+        headers.update(extra_headers)
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         return response
     except requests.RequestException as e:
@@ -48,6 +125,56 @@ def get_page_response(url: str):
         return None
 
 
+def _cache_path(url: str):
+    return _CACHE_DIR / f"{hashlib.md5(url.encode()).hexdigest()}.json"
+
+
+def _write_cache(path: Path, entry: dict):
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(entry))
+    except OSError:
+        pass  # caching is best-effort
+
+
+def get_page_text(url: str):
+    """
+    Gets page HTML, served from an on-disk cache when possible.
+
+    Pages are fetched at most once per day; entries from a previous day
+    are revalidated with a conditional ETag request, so unchanged pages
+    cost a 304 instead of a full download.
+    """
+    path = _cache_path(url)
+    entry = None
+    if path.exists():
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            entry = None
+
+    today = date.today().isoformat()
+    if entry and entry.get("date") == today:
+        return entry["text"]
+
+    extra_headers = (
+        {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else None
+    )
+    response = get_page_response(url, extra_headers)
+    if response is None:
+        # fall back to a stale cache entry rather than returning nothing
+        return entry["text"] if entry else None
+
+    if response.status_code == 304 and entry:
+        entry["date"] = today
+        _write_cache(path, entry)
+        return entry["text"]
+
+    entry = {"date": today, "etag": response.headers.get("ETag"), "text": response.text}
+    _write_cache(path, entry)
+    return entry["text"]
+
+
 def extract_events(max_events: Optional[int] = None):
     """
     Extracts UFC event information from the upcoming events page.
@@ -56,12 +183,16 @@ def extract_events(max_events: Optional[int] = None):
     url = "http://ufcstats.com/statistics/events/upcoming"
     events = []
 
-    response = get_page_response(url)
-    if not response:
+    html = get_page_text(url)
+    if not html:
         return events
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, _PARSER, parse_only=_EVENT_ROW_STRAINER)
     for row in soup.select("tr.b-statistics__table-row"):
+        # Stop parsing rows as soon as enough events have been collected
+        if max_events and len(events) >= max_events:
+            break
+
         event_name = row.select_one("a.b-link")
         event_date = row.select_one("span.b-statistics__date")
         event_location = row.select_one(
@@ -78,9 +209,6 @@ def extract_events(max_events: Optional[int] = None):
                 )
             )
 
-        if max_events and len(events) >= max_events:
-            break
-
     return events
 
 
@@ -91,11 +219,11 @@ def extract_fights(event_url: str):
 
     fights = []
 
-    response = get_page_response(event_url)
-    if not response:
+    html = get_page_text(event_url)
+    if not html:
         return fights
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, _PARSER)
 
     for fight_row in soup.select("tbody > tr.b-fight-details__table-row"):
         fight_link = fight_row.get("data-link")
@@ -130,30 +258,29 @@ def extract_fights(event_url: str):
     return fights
 
 
-def extract_matchup(fight_url: str):
+def _parse_matchup(html: Optional[str]):
     """
-    Extracts matchup data from a fight page.
+    Parses fighter stats out of a fight page's HTML.
     """
     fighter_1_stats = FighterStats()
     fighter_2_stats = FighterStats()
 
-    response = get_page_response(fight_url)
-    if not response:
+    if not html:
         return (fighter_1_stats, fighter_2_stats)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, _PARSER)
 
     current_section = None
 
-    for row in soup.select("tr"):
+    for row in _MATCHUP_ROW.select(soup):
         # Check if it's a section header
-        header = row.select_one("th.b-fight-details__table-col")
+        header = _MATCHUP_HEADER.select_one(row)
         if header:
             current_section = header.get_text(strip=True)
             continue
 
         # Extract data row
-        cols = row.select("td.b-fight-details__table-col")
+        cols = _MATCHUP_COLS.select(row)
         if len(cols) != 3:
             continue  # Skip invalid rows
 
@@ -171,3 +298,48 @@ def extract_matchup(fight_url: str):
             fighter_2_stats.stats[label] = value_2
 
     return (fighter_1_stats, fighter_2_stats)
+
+
+def extract_matchup(fight_url: str):
+    """
+    Extracts matchup data from a fight page.
+    """
+    return _parse_matchup(get_page_text(fight_url))
+
+
+def extract_matchups_bulk(fight_urls: list[str]):
+    """
+    Extracts matchup data for multiple fight pages in parallel.
+
+    The fetches are I/O-bound, so overlapping them in a thread pool turns
+    N sequential round-trips into roughly one.
+    """
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return list(executor.map(extract_matchup, fight_urls))
+
+
+async def _fetch_page_async(client, url: str):
+    try:
+        response = await client.get(url, headers=_HEADERS, timeout=10)
+        response.raise_for_status()
+        return response.text
+    except httpx.HTTPError:
+        return None
+
+
+async def extract_matchups_async(fight_urls: list[str]):
+    """
+    Async variant of extract_matchups_bulk for event-loop callers.
+
+    Fetches all fight pages concurrently over a single httpx client, so
+    the batch costs roughly one round-trip instead of N.
+    """
+    if httpx is None:
+        raise RuntimeError("httpx is required for extract_matchups_async")
+
+    async with httpx.AsyncClient() as client:
+        pages = await asyncio.gather(
+            *(_fetch_page_async(client, url) for url in fight_urls)
+        )
+
+    return [_parse_matchup(html) for html in pages]